@@ -13,32 +13,93 @@ Features:
 Version: 2.0
 """
 
+import argparse
+import asyncio
+import collections
 import subprocess
 import sys
 import os
 import json
 import getpass
+import hashlib
+import mmap
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 from dataclasses import dataclass
 
 # Try to import required packages
 try:
     from transifex.api import transifex_api
+    from transifex.api.jsonapi import DoesNotExist
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError as e:
     missing_pkg = str(e).split("'")[1] if "'" in str(e) else str(e)
     print(f"❌ Missing required package: {missing_pkg}")
     print("📦 Please install with: pip install transifex-python requests")
     sys.exit(1)
 
+# Optional faster JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional TMX compression
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Constants
 DEFAULT_WORKERS = 12
 MAX_WORKERS = 30
+ADD_REMOTE_TIMEOUT = 300
+STDERR_TAIL_LINES = 200
+PROGRESS_INTERVAL = 0.2
+HTTP_TIMEOUT = (5, 60)  # (connect, read) seconds
+TMX_CHUNK_SIZE = 1 << 20
+TMX_POLL_INITIAL = 0.5
+TMX_POLL_MAX = 5.0
+TMX_EXPORT_TIMEOUT = 600
+PROJECT_CACHE_TTL = 3600
+LANGUAGE_CACHE_TTL = 86400
+TMX_CACHE_TTL = 0  # opt-in; reruns re-export everything by default
+PROJECT_CACHE_DIR = Path.home() / ".cache" / "transifex-bulk"
+CONFIG_FILE = Path("bulk_download_config.json")
+# Matches [o:org:p:project:r:resource] section headers in .tx/config
+_RESOURCE_RE = re.compile(rb'^[ \t]*\[o:([^:\]]+):p:([^:\]]+):r:([^\]]+)\]', re.MULTILINE)
 TRANSLATION_MODES = [
     'default', 'reviewed', 'proofread', 'translator', 'untranslated', 
     'onlytranslated', 'onlyreviewed', 'onlyproofread', 'sourceastranslation'
 ]
+# Translation mode menu, built once
+_MODES_PROMPT = "\n".join(f"  [{i}] {mode}" for i, mode in enumerate(TRANSLATION_MODES, 1))
+_MODES_RANGE = f"[1-{len(TRANSLATION_MODES)}]"
+DOWNLOAD_MODE_CHOICES = {"1": "source", "2": "translations", "3": "both"}
+NO_ANSWERS = frozenset({'n', 'no'})
+
+def _json_loads(data: bytes):
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated list in one pass, dropping blanks"""
+    return [item for item in (part.strip() for part in value.split(",")) if item]
 
 @dataclass
 class Config:
@@ -48,19 +109,31 @@ class Config:
     project_slugs: Optional[List[str]] = None
     output_directory: Optional[Path] = None
     file_filter: str = "files/<project_slug>/<resource_slug>/<resource_slug>_<lang>.<ext>"
+    workers: int = DEFAULT_WORKERS
+    add_remote_timeout: int = ADD_REMOTE_TIMEOUT
+    project_cache_ttl: int = PROJECT_CACHE_TTL
+    language_cache_ttl: int = LANGUAGE_CACHE_TTL
+    tmx_cache_ttl: int = TMX_CACHE_TTL
+    compress_tmx: bool = False
     
     @classmethod
     def load_from_file(cls, config_path: Path) -> 'Config':
         """Load configuration from JSON file"""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(config_path, 'rb') as f:
+            data = _json_loads(f.read())
         
         return cls(
             api_token=data.get('api_token', ''),
             organization_slug=data.get('organization_slug', ''),
             project_slugs=data.get('project_slugs'),
             output_directory=Path(data['output_directory']) if data.get('output_directory') else None,
-            file_filter=data.get('file_filter', 'files/<project_slug>/<resource_slug>/<resource_slug>_<lang>.<ext>')
+            file_filter=data.get('file_filter', 'files/<project_slug>/<resource_slug>/<resource_slug>_<lang>.<ext>'),
+            workers=data.get('workers', DEFAULT_WORKERS),
+            add_remote_timeout=data.get('add_remote_timeout', ADD_REMOTE_TIMEOUT),
+            project_cache_ttl=data.get('project_cache_ttl', PROJECT_CACHE_TTL),
+            language_cache_ttl=data.get('language_cache_ttl', LANGUAGE_CACHE_TTL),
+            tmx_cache_ttl=data.get('tmx_cache_ttl', TMX_CACHE_TTL),
+            compress_tmx=data.get('compress_tmx', False)
         )
     
     def save_to_file(self, config_path: Path) -> None:
@@ -71,31 +144,92 @@ class Config:
             'project_slugs': self.project_slugs,
             'output_directory': str(self.output_directory) if self.output_directory else None,
             'file_filter': self.file_filter,
+            'workers': self.workers,
+            'add_remote_timeout': self.add_remote_timeout,
+            'project_cache_ttl': self.project_cache_ttl,
+            'language_cache_ttl': self.language_cache_ttl,
+            'tmx_cache_ttl': self.tmx_cache_ttl,
+            'compress_tmx': self.compress_tmx,
             '_modes': TRANSLATION_MODES
         }
         
         with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            f.write(_json_dumps(data, indent=True))
+
+@dataclass
+class CachedProject:
+    """Minimal stand-in for an API project loaded from the discovery cache"""
+    slug: str
+    name: str
+
+@dataclass
+class RunOptions:
+    """Per-run choices given on the command line; None means ask interactively"""
+    operation: Optional[str] = None
+    project_slugs: Optional[List[str]] = None  # [] selects all projects
+    download_mode: Optional[str] = None
+    translation_mode: Optional[str] = None
+    language_codes: Optional[List[str]] = None  # [] selects all languages
+    tmx_layout: Optional[str] = None
+    workers: Optional[int] = None
+    existing_config: Optional[str] = None
+    force_refresh: Optional[bool] = None
 
 class BulkDownloader:
     """Bulk downloader"""
     
-    def __init__(self, config: Config):
+    # `tx --version` output, shared so later instances skip the subprocess
+    _cli_version: ClassVar[Optional[str]] = None
+    
+    def __init__(self, config: Config, options: Optional[RunOptions] = None):
         self.config = config
+        self.options = options or RunOptions()
         self.organization = None
+        self._project_by_slug = {}
+        self._lang_cache = {}
+        self._lang_fetched = {}
+        # Environment for tx subprocesses, built once and shared by every call
+        self._tx_env = os.environ.copy()
+        self._tx_env['TX_TOKEN'] = self.config.api_token
         self._setup_api()
+        self._setup_session()
         self._verify_cli()
     
     def _setup_api(self) -> None:
         """Initialize Transifex API"""
         transifex_api.setup(auth=self.config.api_token)
     
+    def _setup_session(self) -> None:
+        """Create a pooled HTTP session shared by all direct downloads"""
+        # Sized for the largest thread pool, since --workers may exceed the saved default
+        adapter = HTTPAdapter(
+            pool_maxsize=MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections; safe to call more than once"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def __enter__(self) -> 'BulkDownloader':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def _verify_cli(self) -> None:
         """Verify Transifex CLI is available"""
+        if BulkDownloader._cli_version is not None:
+            return
         try:
             result = subprocess.run(['tx', '--version'], capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                print(f"✅ Transifex CLI: {result.stdout.strip()}")
+                BulkDownloader._cli_version = result.stdout.strip()
+                print(f"✅ Transifex CLI: {BulkDownloader._cli_version}")
             else:
                 raise FileNotFoundError()
         except (FileNotFoundError, subprocess.TimeoutExpired):
@@ -103,22 +237,31 @@ class BulkDownloader:
             print("📋 Install from: https://github.com/transifex/cli/releases")
             sys.exit(1)
     
-    def validate_token_and_org(self) -> None:
+    def _set_api_token(self, api_token: str) -> None:
+        """Switch the SDK and the tx CLI environment over to a new token"""
+        self.config.api_token = api_token
+        self._tx_env['TX_TOKEN'] = api_token
+        self._setup_api()
+    
+    def validate_token_and_org(self, retry_auth: bool = True) -> None:
         """Validate API token and organization"""
         print("🔑 Validating API token and organization...")
         
         try:
             self.organization = transifex_api.Organization.get(slug=self.config.organization_slug)
+            # The organization lookup is authenticated, so its success is
+            # enough to prove the token works without listing projects
             print(f"✅ Organization: {self.organization.name}")
-            
-            # Test project access
-            projects_iter = self.organization.fetch("projects").all()
-            next(projects_iter, None)  # Just test we can access
             print("✅ API access verified")
             
         except Exception as e:
             error_msg = str(e).lower()
-            if "unauthorized" in error_msg or "403" in error_msg:
+            if "unauthorized" in error_msg or "401" in error_msg or "403" in error_msg:
+                # Give an interactive user one chance to supply a working token
+                if retry_auth and sys.stdin.isatty():
+                    print("⚠️  API token was rejected")
+                    self._set_api_token(getpass.getpass("🔑 Enter a valid Transifex API token: "))
+                    return self.validate_token_and_org(retry_auth=False)
                 raise ValueError("API token invalid or insufficient permissions")
             elif "not found" in error_msg or "404" in error_msg:
                 raise ValueError(f"Organization '{self.config.organization_slug}' not found")
@@ -129,33 +272,148 @@ class BulkDownloader:
         """Discover projects in organization"""
         print("🔍 Discovering projects...")
         
-        projects_iterator = self.organization.fetch("projects").all()
+        target_slugs = frozenset(self.config.project_slugs or ())
         
-        if self.config.project_slugs:
-            # Filter to specific projects
-            target_slugs = set(self.config.project_slugs)
-            filtered_projects = []
-            found_slugs = set()
-            
-            for project in projects_iterator:
-                if project.slug in target_slugs:
-                    filtered_projects.append(project)
-                    found_slugs.add(project.slug)
-                    if len(found_slugs) == len(target_slugs):
-                        break
+        cached_projects = self._load_cached_projects()
+        if cached_projects is not None and target_slugs:
+            # A requested project missing from the cache may just be newer than it
+            if not target_slugs.issubset(p.slug for p in cached_projects):
+                cached_projects = None
+        
+        if target_slugs:
+            if cached_projects is not None:
+                filtered_projects = [p for p in cached_projects if p.slug in target_slugs]
+            else:
+                # Point lookups instead of paging through the whole organization
+                filtered_projects = self._lookup_projects(sorted(target_slugs))
             
-            missing_slugs = target_slugs - found_slugs
+            missing_slugs = target_slugs.difference(p.slug for p in filtered_projects)
             if missing_slugs:
-                print(f"⚠️  Projects not found: {', '.join(missing_slugs)}")
+                print(f"⚠️  Projects not found: {', '.join(sorted(missing_slugs))}")
             
-            print(f"📋 Found {len(filtered_projects)} of {len(self.config.project_slugs)} requested projects")
+            print(f"📋 Found {len(filtered_projects)} of {len(target_slugs)} requested projects")
+            self._project_by_slug = {p.slug: p for p in filtered_projects}
             return filtered_projects
         else:
             # Get all projects
-            all_projects = list(projects_iterator)
-            print(f"📋 Found {len(all_projects)} projects in organization")
+            if cached_projects is None:
+                all_projects = list(self.organization.fetch("projects").all())
+                self._save_cached_projects(all_projects)
+                print(f"📋 Found {len(all_projects)} projects in organization")
+            else:
+                all_projects = cached_projects
+                print(f"📋 Found {len(all_projects)} projects in organization (cached)")
+            self._project_by_slug = {p.slug: p for p in all_projects}
             return all_projects
     
+    def _lookup_projects(self, slugs: List[str]) -> List:
+        """Fetch specific projects by slug concurrently; unknown slugs are skipped, other errors raise"""
+        projects_collection = self.organization.fetch("projects")
+        
+        def lookup(slug):
+            try:
+                return projects_collection.get(slug=slug)
+            except DoesNotExist:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(slugs))) as executor:
+            return [p for p in executor.map(lookup, slugs) if p is not None]
+    
+    def _project_cache_path(self) -> Path:
+        """Cache file keyed by organization and a short hash of the API token"""
+        token_hash = hashlib.sha1(self.config.api_token.encode('utf-8')).hexdigest()[:8]
+        return PROJECT_CACHE_DIR / f"{self.config.organization_slug}-{token_hash}.json"
+    
+    def _read_cache(self, cache_path: Path, ttl: int):
+        """Load a JSON cache file if it is younger than ttl seconds"""
+        if ttl <= 0:
+            return None
+        try:
+            if time.time() - cache_path.stat().st_mtime > ttl:
+                return None
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, cache_path: Path, data) -> None:
+        """Atomically write a JSON cache file"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(_json_dumps(data))
+                    # Make the data durable before the rename makes it visible
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write cache {cache_path.name}: {e}")
+    
+    def _load_cached_projects(self) -> Optional[List[CachedProject]]:
+        """Load the discovered project list if the cache is younger than the TTL"""
+        data = self._read_cache(self._project_cache_path(), self.config.project_cache_ttl)
+        if data is None:
+            return None
+        try:
+            return [CachedProject(slug=p['slug'], name=p.get('name', p['slug'])) for p in data]
+        except (KeyError, TypeError, AttributeError):
+            return None
+    
+    def _save_cached_projects(self, projects: List) -> None:
+        """Atomically write the discovered project list to the cache"""
+        self._write_cache(self._project_cache_path(), [{'slug': p.slug, 'name': p.name} for p in projects])
+    
+    def _language_cache_path(self) -> Path:
+        """Per-project language codes, stored next to the project cache"""
+        project_cache = self._project_cache_path()
+        return project_cache.with_name(f"{project_cache.stem}-languages.json")
+    
+    def _read_language_cache(self) -> dict:
+        """Unexpired {slug: {'fetched': timestamp, 'codes': [...]}} entries from disk"""
+        ttl = self.config.language_cache_ttl
+        data = self._read_cache(self._language_cache_path(), ttl)
+        if not isinstance(data, dict):
+            return {}
+        now = time.time()
+        entries = {}
+        for project_slug, entry in data.items():
+            try:
+                if now - entry['fetched'] <= ttl and isinstance(entry['codes'], list):
+                    entries[project_slug] = entry
+            except (KeyError, TypeError):
+                continue
+        return entries
+    
+    def _load_cached_languages(self) -> None:
+        """Seed the in-process language cache from unexpired disk entries"""
+        for project_slug, entry in self._read_language_cache().items():
+            if project_slug not in self._lang_cache:
+                self._lang_cache[project_slug] = [
+                    transifex_api.Language(id=f"l:{code}", attributes={'code': code}) for code in entry['codes']
+                ]
+    
+    def _save_cached_languages(self) -> None:
+        """Add the languages fetched in this run to the disk cache"""
+        entries = self._read_language_cache()
+        for project_slug, (fetched, languages) in self._lang_fetched.items():
+            entries[project_slug] = {'fetched': fetched, 'codes': [lang.code for lang in languages]}
+        self._write_cache(self._language_cache_path(), entries)
+        self._lang_fetched.clear()
+    
+    def _get_languages(self, project_slug: str, project) -> List:
+        """Languages of a project, fetched from the API once per project"""
+        languages = self._lang_cache.get(project_slug)
+        if languages is None:
+            languages = list(project.fetch("languages").all())
+            self._lang_cache[project_slug] = languages
+            self._lang_fetched[project_slug] = (time.time(), languages)
+        return languages
+    
     def setup_working_directory(self, projects: List) -> tuple[Path, bool]:
         """Setup working directory and return (work_dir, skip_config_generation)"""
         if self.config.output_directory:
@@ -173,20 +431,26 @@ class BulkDownloader:
         tx_config_path = base_dir / ".tx" / "config"
         if tx_config_path.exists():
             print(f"📁 Found existing .tx/config in {base_dir}")
-            choice = input("Use existing config? [Y/n]: ").strip().lower()
-            if choice not in ['n', 'no']:
+            if self.options.existing_config is None:
+                choice = input("Use existing config? [Y/n]: ").strip().lower()
+            else:
+                choice = 'n' if self.options.existing_config == 'replace' else 'y'
+            if choice not in NO_ANSWERS:
                 # Create local .transifexrc to ensure CLI uses correct token
                 self._create_local_transifexrc(base_dir)
                 return base_dir, True  # Skip config generation, return base_dir for tx commands
             
-            # Remove existing and reinitialize
-            tx_config_path.unlink()
+            # Move existing aside and reinitialize; a rename is a single
+            # directory-entry update regardless of config size
+            backup_path = tx_config_path.with_name(f"config.backup.{int(time.time())}")
+            os.replace(tx_config_path, backup_path)
+            print(f"🗄️  Previous config saved as {backup_path.name}")
         
         # Initialize new tx project in base directory
         print(f"🔧 Initializing Transifex project in {base_dir}")
-        result = subprocess.run(['tx', 'init'], cwd=base_dir, capture_output=True, text=True)
+        result = subprocess.run(['tx', 'init'], cwd=base_dir, capture_output=True)
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to initialize tx project: {result.stderr}")
+            raise RuntimeError(f"Failed to initialize tx project: {result.stderr.decode('utf-8', 'replace')}")
         
         # Create local .transifexrc to ensure CLI uses correct token
         self._create_local_transifexrc(base_dir)
@@ -205,9 +469,14 @@ username = api
 password = {self.config.api_token}
 """
             
-            # Write the file
-            with open(transifexrc_path, 'w', encoding='utf-8') as f:
-                f.write(config_content)
+            # Single raw write; the file holds the token, so keep it owner-only
+            fd = os.open(transifexrc_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                # The mode above only applies to new files; tighten an older one too
+                os.fchmod(fd, 0o600)
+                os.write(fd, config_content.encode('utf-8'))
+            finally:
+                os.close(fd)
             
             print(f"📝 Created local .transifexrc in {work_dir}")
             
@@ -223,16 +492,50 @@ password = {self.config.api_token}
         
         print("⚙️ Adding projects to configuration...")
         
-        env = os.environ.copy()
-        env['TX_TOKEN'] = self.config.api_token
+        # Each project gets its own scratch copy of the project root so the
+        # CLI calls can run concurrently without fighting over .tx/config
+        parts_dir = Path(tempfile.mkdtemp(prefix='.txadd_', dir=work_dir))
+        try:
+            results = asyncio.run(self._add_all_projects(projects, work_dir, parts_dir))
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
         
         added_count = 0
         failed_count = 0
+        sections = []
         
-        for i, project in enumerate(projects, 1):
-            # Clear the line and print the full project slug
-            print(f"\rAdding projects ({i}/{len(projects)}): {project.slug}" + " " * 20, end="", flush=True)
-            
+        # Merge serially, in discovery order
+        for project, error, fragment in results:
+            if error is not None:
+                print(f"\r⚠️  Failed to add {project.slug}: {error}")
+                failed_count += 1
+            else:
+                if fragment:
+                    sections.append(fragment.strip())
+                added_count += 1
+        
+        if sections:
+            with open(work_dir / ".tx" / "config", 'a', encoding='utf-8') as f:
+                f.write("\n" + "\n\n".join(sections) + "\n")
+        
+        print(f"\r📦 Configuration complete: ✅{added_count} ❌{failed_count}" + " " * 30)
+        print()
+    
+    async def _add_all_projects(self, projects: List, work_dir: Path, parts_dir: Path) -> List[tuple]:
+        """Run tx add remote for all projects concurrently, bounded by workers"""
+        semaphore = asyncio.Semaphore(max(1, min(self.config.workers, MAX_WORKERS)))
+        progress = {'done': 0, 'total': len(projects), 'last_print': 0.0}
+        
+        return await asyncio.gather(*[
+            self._add_single_project(project, work_dir, parts_dir, semaphore, progress)
+            for project in projects
+        ])
+    
+    async def _add_single_project(self, project, work_dir: Path, parts_dir: Path,
+                                  semaphore: asyncio.Semaphore, progress: dict) -> tuple:
+        """Add one project in a private directory, return (project, error, config_fragment)"""
+        async with semaphore:
+            project_dir = parts_dir / project.slug
             project_url = f"https://app.transifex.com/{self.config.organization_slug}/{project.slug}"
             
             cmd = [
@@ -241,17 +544,70 @@ password = {self.config.api_token}
                 project_url
             ]
             
-            result = subprocess.run(cmd, cwd=work_dir, env=env, capture_output=True, text=True)
+            error = None
+            fragment = ""
+            process = None
+            try:
+                (project_dir / ".tx").mkdir(parents=True)
+                shutil.copyfile(work_dir / ".tx" / "config", project_dir / ".tx" / "config")
+                if (work_dir / ".transifexrc").exists():
+                    shutil.copyfile(work_dir / ".transifexrc", project_dir / ".transifexrc")
+                
+                # Results are read back from the private .tx/config, so stdout
+                # is discarded and only the tail of stderr is kept for errors
+                process = await asyncio.create_subprocess_exec(
+                    *cmd, cwd=project_dir, env=self._tx_env,
+                    stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+                )
+                stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+                try:
+                    await asyncio.wait_for(self._drain_stderr(process, stderr_tail), timeout=self.config.add_remote_timeout)
+                except asyncio.TimeoutError:
+                    error = f"timed out after {self.config.add_remote_timeout}s"
+                else:
+                    if process.returncode != 0:
+                        error = ("\n".join(stderr_tail).strip()
+                                 or f"exit code {process.returncode}")
+                    else:
+                        # Everything from the first resource header on belongs
+                        # to this project; the [main] section is already shared
+                        config_bytes = (project_dir / ".tx" / "config").read_bytes()
+                        match = _RESOURCE_RE.search(config_bytes)
+                        if match:
+                            fragment = config_bytes[match.start():].decode('utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                error = str(e)
+            finally:
+                # Covers timeouts as well as cancellation (e.g. Ctrl-C), so no
+                # tx child outlives the scratch directory it runs in
+                if process is not None and process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
             
-            if result.returncode != 0:
-                print(f"\r⚠️  Failed to add {project.slug}: {result.stderr.strip()}")
-                failed_count += 1
-            else:
-                resources_added = result.stdout.count('[o:')
-                added_count += 1
-        
-        print(f"\r📦 Configuration complete: ✅{added_count} ❌{failed_count}" + " " * 30)
-        print()
+            progress['done'] += 1
+            # Redraw at most every PROGRESS_INTERVAL; the final count always shows
+            now = time.monotonic()
+            if now - progress['last_print'] >= PROGRESS_INTERVAL or progress['done'] == progress['total']:
+                progress['last_print'] = now
+                print(f"\rAdding projects ({progress['done']}/{progress['total']}): {project.slug}" + " " * 20, end="", flush=True)
+            
+            return project, error, fragment
+    
+    async def _drain_stderr(self, process, stderr_tail: collections.deque) -> int:
+        """Keep the last STDERR_TAIL_LINES lines of stderr and wait for the process to exit"""
+        while True:
+            try:
+                line = await process.stderr.readline()
+            except ValueError:
+                # A single line longer than the stream limit; it was discarded
+                continue
+            if not line:
+                break
+            stderr_tail.append(line.decode('utf-8', 'replace').rstrip())
+        return await process.wait()
     
     def _count_resources_in_config(self, work_dir: Path) -> int:
         """Count resources in existing .tx/config file"""
@@ -260,16 +616,42 @@ password = {self.config.api_token}
             return 0
         
         try:
-            resource_count = 0
-            with open(config_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # Count lines that start with [o:org:p:project:r:resource]
-                    if line.strip().startswith('[o:') and ':p:' in line and ':r:' in line:
-                        resource_count += 1
-            return resource_count
+            with open(config_path, 'rb') as f:
+                # mmap cannot map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    return 0
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return sum(1 for _ in _RESOURCE_RE.finditer(mm))
+                except (OSError, ValueError):
+                    # Line mode fallback; the cheap substring test skips
+                    # key = value lines before they reach the regex
+                    f.seek(0)
+                    return sum(1 for line in f if b'[o:' in line and _RESOURCE_RE.match(line))
         except Exception:
             return 0
     
+    def _count_files(self, root: Path, skip_name: Optional[str] = None) -> int:
+        """Count visible files under root with an os.scandir walk"""
+        total = 0
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    # Skips dotfiles as well as .tx and other hidden dirs
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif name != skip_name and entry.is_file():
+                        total += 1
+        return total
+    
     def _count_downloaded_files(self, work_dir: Path) -> int:
         """Count actual downloaded files (check both files dir and direct)"""
         try:
@@ -278,18 +660,11 @@ password = {self.config.api_token}
             # First check the files subdirectory (preferred location)
             files_dir = work_dir / "files"
             if files_dir.exists():
-                for file_path in files_dir.rglob("*"):
-                    if file_path.is_file() and not file_path.name.startswith('.'):
-                        file_count += 1
+                file_count = self._count_files(files_dir)
             
             # If no files in 'files' dir, check direct in work_dir (fallback)
             if file_count == 0:
-                for file_path in work_dir.rglob("*"):
-                    if (file_path.is_file() and 
-                        not file_path.name.startswith('.') and 
-                        not file_path.name == 'config' and
-                        '.tx' not in str(file_path)):
-                        file_count += 1
+                file_count = self._count_files(work_dir, skip_name='config')
             
             return file_count
         except Exception:
@@ -300,22 +675,22 @@ password = {self.config.api_token}
         print("\n🚀 Starting file download...")
         
         # Ask for download mode
-        print("\n📥 Download mode:")
-        print("  [1] Source files only")
-        print("  [2] Translation files only")
-        print("  [3] Both source and translations")
-        mode_choice = input("Choose [1/2/3]: ").strip()
-        mode_map = {"1": "source", "2": "translations", "3": "both"}
-        download_mode = mode_map.get(mode_choice, "both")
+        download_mode = self.options.download_mode
+        if download_mode is None:
+            print("\n📥 Download mode:")
+            print("  [1] Source files only")
+            print("  [2] Translation files only")
+            print("  [3] Both source and translations")
+            mode_choice = input("Choose [1/2/3]: ").strip()
+            download_mode = DOWNLOAD_MODE_CHOICES.get(mode_choice, "both")
         
         # Ask for translation mode if downloading translations
-        translation_mode = "default"
-        if download_mode in ["translations", "both"]:
+        translation_mode = self.options.translation_mode or "default"
+        if download_mode in ["translations", "both"] and self.options.translation_mode is None:
             print("\n🎯 Translation mode:")
-            for i, mode in enumerate(TRANSLATION_MODES, 1):
-                print(f"  [{i}] {mode}")
+            print(_MODES_PROMPT)
             
-            mode_choice = input(f"Choose [1-{len(TRANSLATION_MODES)}]: ").strip()
+            mode_choice = input(f"Choose {_MODES_RANGE}: ").strip()
             try:
                 mode_idx = int(mode_choice) - 1
                 if 0 <= mode_idx < len(TRANSLATION_MODES):
@@ -324,26 +699,27 @@ password = {self.config.api_token}
                 pass
         
         # Ask for language selection
-        language_codes = None
-        if download_mode in ["translations", "both"]:
+        language_codes = self.options.language_codes or None
+        if download_mode in ["translations", "both"] and self.options.language_codes is None:
             print("\n🌐 Languages:")
             print("  [1] All languages")
             print("  [2] Specific languages")
             lang_choice = input("Choose [1/2]: ").strip()
             
             if lang_choice == "2":
-                lang_input = input("Enter language codes (e.g. en,es,fr): ").strip()
-                if lang_input:
-                    language_codes = [code.strip() for code in lang_input.split(",")]
+                lang_input = input("Enter language codes (e.g. en,es,fr): ")
+                language_codes = _split_csv(lang_input) or None
         
         # Ask for number of workers
-        print("\n👥 Workers:")
-        workers_input = input(f"Number of workers [1-{MAX_WORKERS}, default {DEFAULT_WORKERS}]: ").strip()
-        try:
-            workers = int(workers_input) if workers_input else DEFAULT_WORKERS
-            workers = max(1, min(workers, MAX_WORKERS))
-        except ValueError:
-            workers = DEFAULT_WORKERS
+        workers = self.options.workers
+        if workers is None:
+            print("\n👥 Workers:")
+            workers_input = input(f"Number of workers [1-{MAX_WORKERS}, default {self.config.workers}]: ").strip()
+            try:
+                workers = int(workers_input) if workers_input else self.config.workers
+            except ValueError:
+                workers = self.config.workers
+        workers = max(1, min(workers, MAX_WORKERS))
         
         # Build command
         cmd = ['tx', 'pull']
@@ -370,15 +746,11 @@ password = {self.config.api_token}
         # Workers
         cmd.extend(['--workers', str(workers)])
         
-        # Environment
-        env = os.environ.copy()
-        env['TX_TOKEN'] = self.config.api_token
-        
         print(f"🔧 Command: {' '.join(cmd)}")
         print(f"📁 Working directory: {work_dir}")
         
         # Execute download
-        result = subprocess.run(cmd, cwd=work_dir, env=env, text=True)
+        result = subprocess.run(cmd, cwd=work_dir, env=self._tx_env)
         
         # Check if files were actually downloaded despite error code
         downloaded_files = self._count_downloaded_files(work_dir)
@@ -401,127 +773,306 @@ password = {self.config.api_token}
                 print("💡 Try reducing workers or checking network connectivity")
                 return False
     
+    def _request_tmx_url(self, **kwargs) -> str:
+        """Create a TMX export job and poll it with exponential backoff until ready or timed out"""
+        # The SDK's TmxAsyncDownload.download() polls at a fixed 5s, which
+        # makes every small export wait at least that long
+        download = transifex_api.TmxAsyncDownload.create(**kwargs)
+        deadline = time.monotonic() + TMX_EXPORT_TIMEOUT
+        delay = TMX_POLL_INITIAL
+        while True:
+            errors = getattr(download, 'errors', None)
+            if errors:
+                raise RuntimeError(errors[0].get('detail', errors[0]))
+            if download.redirect:
+                return download.redirect
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"TMX export not ready after {TMX_EXPORT_TIMEOUT}s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, TMX_POLL_MAX)
+            download.reload()
+    
+    def _tmx_path(self, tmx_dir: Path, name: str) -> Path:
+        """Where a TMX export is stored, <name>.tmx.zst when compression is enabled"""
+        return tmx_dir / (name + ".zst" if self.config.compress_tmx else name)
+    
+    def _fresh_tmx_names(self, tmx_dir: Path, names: List[str]) -> set:
+        """Names of TMX exports already on disk and younger than tmx_cache_ttl"""
+        if self.config.tmx_cache_ttl <= 0:
+            return set()
+        fresh = set()
+        now = time.time()
+        for name in names:
+            try:
+                stat = self._tmx_path(tmx_dir, name).stat()
+            except OSError:
+                continue
+            if stat.st_size > 0 and now - stat.st_mtime < self.config.tmx_cache_ttl:
+                fresh.add(name)
+        return fresh
+    
+    def _save_tmx(self, tmx_dir: Path, name: str, chunks) -> None:
+        """Stream a TMX export to disk, zstd-compressed when enabled"""
+        tmx_file = self._tmx_path(tmx_dir, name)
+        # Written under a temporary name so an interrupted download never
+        # looks like a complete file to the freshness check
+        temp_path = tmx_file.with_name(tmx_file.name + ".part")
+        try:
+            with open(temp_path, 'wb') as f:
+                if self.config.compress_tmx:
+                    writer = zstandard.ZstdCompressor(level=3).stream_writer(f)
+                    for chunk in chunks:
+                        writer.write(chunk)
+                    writer.flush(zstandard.FLUSH_FRAME)
+                else:
+                    for chunk in chunks:
+                        f.write(chunk)
+            os.replace(temp_path, tmx_file)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _tmx_name(project_slug: str, language=None) -> str:
+        """File name of the TMX export for a project, or one language of it"""
+        if language is None:
+            return f"{project_slug}_all_languages.tmx"
+        return f"{project_slug}_{language.code}.tmx"
+    
+    def _download_one_tmx(self, tmx_dir: Path, project_slug: str, project, language=None):
+        """Export one project (or one language of it) as TMX; returns (file name, saved)"""
+        name = self._tmx_name(project_slug, language)
+        if language is None:
+            url = self._request_tmx_url(project=project)
+        else:
+            url = self._request_tmx_url(project=project, language=language)
+        
+        # Streamed so a worker holds one chunk at a time, not the whole export
+        with self._session.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+            if response.status_code != 200:
+                return name, False
+            self._save_tmx(tmx_dir, name, response.iter_content(chunk_size=TMX_CHUNK_SIZE))
+        return name, True
+    
     def execute_tmx_download(self, work_dir: Path) -> bool:
         """Execute TMX download using Python SDK"""
         print("\n🚀 Starting TMX download...")
         
         # Ask for project selection
-        print("\n📋 Which projects?")
-        print("  [1] All projects in organization")
-        print("  [2] Specific projects")
-        project_choice = input("Choose [1/2]: ").strip()
-        
-        if project_choice == "2":
-            project_input = input("Enter project slugs (comma-separated): ").strip()
-            if project_input:
-                project_slugs = [slug.strip() for slug in project_input.split(",")]
-            else:
-                print("❌ No projects specified")
-                return False
-        else:
+        project_slugs = self.options.project_slugs
+        if project_slugs is None:
+            print("\n📋 Which projects?")
+            print("  [1] All projects in organization")
+            print("  [2] Specific projects")
+            project_choice = input("Choose [1/2]: ").strip()
+            
+            if project_choice == "2":
+                project_slugs = _split_csv(input("Enter project slugs (comma-separated): "))
+                if not project_slugs:
+                    print("❌ No projects specified")
+                    return False
+        
+        if not project_slugs:
             # Get all projects
             projects = self.discover_projects()
             project_slugs = [p.slug for p in projects]
         
         # Ask for language selection
-        print("\n🌐 Language options:")
-        print("  [1] One file per project (all languages combined)")
-        print("  [2] Separate files per language (all languages)")
-        print("  [3] Separate files for specific languages")
-        language_choice = input("Choose [1/2/3]: ").strip()
-        
-        specific_languages = None
-        if language_choice == "3":
-            lang_input = input("Enter language codes (e.g. en,es,fr): ").strip()
-            if lang_input:
-                specific_languages = [code.strip() for code in lang_input.split(",")]
+        specific_languages = self.options.language_codes or None
+        if self.options.tmx_layout == "combined":
+            language_choice = "1"
+        elif self.options.tmx_layout == "per-language" or specific_languages:
+            language_choice = "3" if specific_languages else "2"
+        else:
+            print("\n🌐 Language options:")
+            print("  [1] One file per project (all languages combined)")
+            print("  [2] Separate files per language (all languages)")
+            print("  [3] Separate files for specific languages")
+            language_choice = input("Choose [1/2/3]: ").strip()
+            
+            if language_choice == "3":
+                lang_input = input("Enter language codes (e.g. en,es,fr): ")
+                specific_languages = _split_csv(lang_input) or None
+        
+        # Same pool size as tx pull; --workers is already applied to the config
+        workers = max(1, min(self.config.workers, MAX_WORKERS))
         
         tmx_dir = work_dir / "TMX files"
         tmx_dir.mkdir(exist_ok=True)
         
         success_count = 0
+        skipped_count = 0
         failed_count = 0
-        total_files = 0
         
-        # Calculate total files for progress
-        if language_choice == "1":
-            total_files = len(project_slugs)
-        else:
-            # We'll need to count languages per project, so we'll update progress dynamically
-            total_files = len(project_slugs)  # Initial estimate
+        # A slug entered twice would otherwise export the same files twice
+        unique_slugs = list(dict.fromkeys(project_slugs))
+        if len(unique_slugs) < len(project_slugs):
+            print(f"⏭️  Skipping {len(project_slugs) - len(unique_slugs)} duplicate project slugs")
+            project_slugs = unique_slugs
         
-        file_counter = 0
+        # Resolve projects and languages up front so the exports can run in parallel
+        # An empty specific-language answer falls back to all languages
+        language_filter = frozenset(specific_languages or ()) if language_choice == "3" else frozenset()
+        if language_choice != "1":
+            self._load_cached_languages()
+        # A cached discovery only has slugs. Resolve the stubs needed here with
+        # point lookups, or with one paged listing when they are most of the org
+        stub_slugs = [slug for slug in project_slugs if isinstance(self._project_by_slug.get(slug), CachedProject)]
+        if stub_slugs:
+            if len(stub_slugs) * 2 > len(self._project_by_slug):
+                resolved = self.organization.fetch("projects").all()
+            else:
+                resolved = self._lookup_projects(stub_slugs)
+            self._project_by_slug.update((p.slug, p) for p in resolved)
         
+        tasks = []
         for project_slug in project_slugs:
             try:
-                # Get project object
-                project = self.organization.fetch("projects").get(slug=project_slug)
+                # Reuse the project object from discovery; slugs given
+                # directly still need the API lookup
+                project = self._project_by_slug.get(project_slug)
+                if isinstance(project, CachedProject):
+                    # Listed in the cache but not found when resolved above
+                    raise LookupError("project not found")
+                if project is None:
+                    project = self.organization.fetch("projects").get(slug=project_slug)
                 
                 if language_choice == "1":
                     # One file for all languages
-                    file_counter += 1
-                    print(f"\rDownloading TMX ({file_counter}/{total_files}): {project_slug}_all_languages.tmx" + " " * 10, end="", flush=True)
-                    
-                    url = transifex_api.TmxAsyncDownload.download(project=project)
-                    response = requests.get(url)
-                    
-                    if response.status_code == 200:
-                        tmx_file = tmx_dir / f"{project_slug}_all_languages.tmx"
-                        with open(tmx_file, 'wb') as f:
-                            f.write(response.content)
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                
-                else:
-                    # Separate files per language
-                    if language_choice == "2":
-                        # All languages
-                        languages = list(project.fetch("languages").all())
-                    else:
-                        # Specific languages
-                        all_languages = list(project.fetch("languages").all())
-                        languages = [lang for lang in all_languages if lang.code in specific_languages]
-                    
-                    # Update total files count for better progress tracking
-                    if project_slug == project_slugs[0]:  # First project
-                        total_files = len(project_slugs) * len(languages)
-                    
-                    for language in languages:
-                        file_counter += 1
-                        print(f"\rDownloading TMX ({file_counter}/{total_files}): {project_slug}_{language.code}.tmx" + " " * 10, end="", flush=True)
-                        
-                        url = transifex_api.TmxAsyncDownload.download(project=project, language=language)
-                        response = requests.get(url)
-                        
-                        if response.status_code == 200:
-                            tmx_file = tmx_dir / f"{project_slug}_{language.code}.tmx"
-                            with open(tmx_file, 'wb') as f:
-                                f.write(response.content)
-                            success_count += 1
-                        else:
-                            failed_count += 1
+                    tasks.append((project_slug, project, None))
+                    continue
                 
+                languages = self._get_languages(project_slug, project)
+                if language_filter:
+                    languages = [lang for lang in languages if lang.code in language_filter]
+                tasks.extend((project_slug, project, language) for language in languages)
+            
             except Exception as e:
                 failed_count += 1
                 if failed_count <= 3:  # Show first few errors
-                    print(f"\r⚠️  Error with {project_slug}: {e}")
+                    print(f"⚠️  Error with {project_slug}: {e}")
+        
+        if self._lang_fetched:
+            self._save_cached_languages()
+        
+        # Recent exports from an earlier run are kept unless a refresh is forced
+        fresh = self._fresh_tmx_names(tmx_dir, [self._tmx_name(t[0], t[2]) for t in tasks])
+        if fresh:
+            force_refresh = self.options.force_refresh
+            if force_refresh is None and not sys.stdin.isatty():
+                force_refresh = False
+            elif force_refresh is None:
+                hours = self.config.tmx_cache_ttl / 3600
+                choice = input(f"\n♻️  Keep {len(fresh)} TMX files downloaded in the last {hours:g}h? [Y/n]: ").strip().lower()
+                force_refresh = choice in NO_ANSWERS
+            if not force_refresh:
+                tasks = [t for t in tasks if self._tmx_name(t[0], t[2]) not in fresh]
+                skipped_count = len(fresh)
+                print(f"⏭️  Skipping {len(fresh)} up-to-date TMX files")
         
-        print(f"\r📊 TMX download complete: ✅{success_count} ❌{failed_count}" + " " * 30)
+        total_files = len(tasks)
+        file_counter = 0
+        last_print = 0.0
+        
+        # Exports are network-bound; each worker streams its file to disk
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(self._download_one_tmx, tmx_dir, *task): task for task in tasks}
+            for future in as_completed(futures):
+                file_counter += 1
+                project_slug = futures[future][0]
+                try:
+                    name, saved = future.result()
+                except Exception as e:
+                    failed_count += 1
+                    if failed_count <= 3:  # Show first few errors
+                        print(f"\r⚠️  Error with {project_slug}: {e}")
+                    continue
+                
+                # Redraw at most every PROGRESS_INTERVAL; the final count always shows
+                now = time.monotonic()
+                if now - last_print >= PROGRESS_INTERVAL or file_counter == total_files:
+                    last_print = now
+                    print(f"\rDownloading TMX ({file_counter}/{total_files}): {name}" + " " * 10, end="", flush=True)
+                if saved:
+                    success_count += 1
+                else:
+                    failed_count += 1
+        except BaseException:
+            # Don't start the queued exports when interrupted, e.g. by Ctrl-C
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        
+        summary = f"✅{success_count} ⏭️{skipped_count} " if skipped_count else f"✅{success_count} "
+        print(f"\r📊 TMX download complete: {summary}❌{failed_count}" + " " * 30)
         print()
-        return success_count > 0
+        return success_count + skipped_count > 0
 
-def get_api_token() -> str:
+def get_api_token(interactive: bool = True) -> str:
     """Get API token from environment or user input"""
     token = os.getenv("TX_TOKEN") or os.getenv("TRANSIFEX_API_TOKEN")
     if token:
         print("✅ Using API token from environment")
         return token
+    if not interactive:
+        return ""
     return getpass.getpass("🔑 Enter your Transifex API token: ")
 
+def _selection_arg(value: str) -> List[str]:
+    """Parse a comma-separated selection flag; 'all' becomes an empty list"""
+    if value.strip().lower() == "all":
+        return []
+    items = _split_csv(value)
+    if not items:
+        raise argparse.ArgumentTypeError("expected 'all' or a comma-separated list")
+    return items
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line flags; anything left out is asked interactively"""
+    parser = argparse.ArgumentParser(
+        description="Bulk download translation files and TMX files from Transifex"
+    )
+    parser.add_argument('--api-token', help="Transifex API token (default: TX_TOKEN or TRANSIFEX_API_TOKEN)")
+    parser.add_argument('--org', help="organization slug")
+    parser.add_argument('--output', type=Path, help="output directory (default: ./transifex_downloads)")
+    parser.add_argument('--operation', choices=['files', 'tmx'], help="what to download")
+    parser.add_argument('--projects', type=_selection_arg, help="'all' or comma-separated project slugs")
+    parser.add_argument('--mode', choices=['source', 'translations', 'both'], help="file download mode")
+    parser.add_argument('--translation-mode', choices=TRANSLATION_MODES, help="tx pull translation mode")
+    parser.add_argument('--languages', type=_selection_arg, help="'all' or comma-separated language codes")
+    parser.add_argument('--tmx-layout', choices=['combined', 'per-language'], help="one TMX per project or per language")
+    parser.add_argument('--workers', type=int, help=f"parallel workers (1-{MAX_WORKERS})")
+    parser.add_argument('--existing-config', choices=['reuse', 'replace'], help="what to do with an existing .tx/config")
+    parser.add_argument('--refresh', action='store_true', help="ignore the cached project and language lists")
+    parser.add_argument('--force-refresh', action=argparse.BooleanOptionalAction,
+                        help="re-download TMX files even if a recent copy exists (default: ask, or keep them when not interactive)")
+    parser.add_argument('--compress', action='store_true', help="zstd-compress TMX files (requires zstandard)")
+    return parser.parse_args(argv)
+
+def get_config_from_args(args: argparse.Namespace) -> Config:
+    """Build configuration from flags, the saved config file and the environment"""
+    if CONFIG_FILE.exists():
+        config = Config.load_from_file(CONFIG_FILE)
+    else:
+        config = Config(api_token='', organization_slug='')
+    
+    if args.org:
+        config.organization_slug = args.org
+    if args.api_token:
+        config.api_token = args.api_token
+    elif not config.api_token or config.api_token.startswith('***'):
+        config.api_token = get_api_token(interactive=sys.stdin.isatty())
+    
+    if not config.organization_slug:
+        raise ValueError("Organization slug is required (--org)")
+    if not config.api_token:
+        raise ValueError("API token is required (--api-token or TX_TOKEN)")
+    return config
+
 def get_user_config() -> Config:
     """Get configuration from user input or file"""
-    config_path = Path("bulk_download_config.json")
+    config_path = CONFIG_FILE
     
     if config_path.exists():
         try:
@@ -577,7 +1128,7 @@ def get_user_config() -> Config:
     )
     
     # Save configuration
-    if input(f"\n💾 Save configuration? [Y/n]: ").strip().lower() not in ['n', 'no']:
+    if input(f"\n💾 Save configuration? [Y/n]: ").strip().lower() not in NO_ANSWERS:
         try:
             config.save_to_file(config_path)
             print("✅ Configuration saved")
@@ -586,64 +1137,98 @@ def get_user_config() -> Config:
     
     return config
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
+    args = parse_args(argv)
+    options = RunOptions(
+        operation=args.operation,
+        project_slugs=args.projects,
+        download_mode=args.mode,
+        translation_mode=args.translation_mode,
+        language_codes=args.languages,
+        tmx_layout=args.tmx_layout,
+        workers=args.workers,
+        existing_config=args.existing_config,
+        force_refresh=args.force_refresh
+    )
+    
     try:
         print("🚀 Transifex Bulk Downloader")
         
         # Choose operation type
-        print("\n📋 What would you like to download?")
-        print("  [1] Source/Translation files")
-        print("  [2] Translation Memory files")
+        if options.operation is None:
+            print("\n📋 What would you like to download?")
+            print("  [1] Source/Translation files")
+            print("  [2] Translation Memory files")
+            
+            operation = input("Choose [1/2]: ").strip()
+        else:
+            operation = "2" if options.operation == "tmx" else "1"
         
-        operation = input("Choose [1/2]: ").strip()
+        # Prompt for settings only when running interactively without flags
+        if args.org or args.api_token or not sys.stdin.isatty():
+            config = get_config_from_args(args)
+        else:
+            config = get_user_config()
         
-        config = get_user_config()
-        downloader = BulkDownloader(config)
-        downloader.validate_token_and_org()
+        if args.output:
+            config.output_directory = args.output
+        if args.workers is not None:
+            config.workers = max(1, min(args.workers, MAX_WORKERS))
+        if args.refresh:
+            config.project_cache_ttl = 0
+            config.language_cache_ttl = 0
+        if args.compress:
+            config.compress_tmx = True
+        if config.compress_tmx and zstandard is None:
+            raise ValueError("TMX compression requires the zstandard package: pip install zstandard")
         
-        if operation == "2":
-            # TMX download
-            base_dir = config.output_directory or Path.cwd() / "transifex_downloads"
-            base_dir.mkdir(parents=True, exist_ok=True)
-            success = downloader.execute_tmx_download(base_dir)
-        else:
-            # File download - ask for project selection
-            print("\n📋 Which projects?")
-            print("  [1] All projects in organization")
-            print("  [2] Specific projects")
-            project_choice = input("Choose [1/2]: ").strip()
+        with BulkDownloader(config, options) as downloader:
+            downloader.validate_token_and_org()
             
-            if project_choice == "2":
-                project_input = input("Enter project slugs (comma-separated): ").strip()
-                if project_input:
-                    config.project_slugs = [slug.strip() for slug in project_input.split(",")]
+            if operation == "2":
+                # TMX download
+                base_dir = config.output_directory or Path.cwd() / "transifex_downloads"
+                base_dir.mkdir(parents=True, exist_ok=True)
+                success = downloader.execute_tmx_download(base_dir)
+            else:
+                # File download - ask for project selection
+                if options.project_slugs is not None:
+                    config.project_slugs = options.project_slugs or None
                 else:
-                    print("❌ No projects specified")
+                    print("\n📋 Which projects?")
+                    print("  [1] All projects in organization")
+                    print("  [2] Specific projects")
+                    project_choice = input("Choose [1/2]: ").strip()
+                    
+                    if project_choice == "2":
+                        config.project_slugs = _split_csv(input("Enter project slugs (comma-separated): "))
+                        if not config.project_slugs:
+                            print("❌ No projects specified")
+                            return
+                    else:
+                        config.project_slugs = None  # All projects
+                
+                projects = downloader.discover_projects()
+                if not projects:
+                    print("❌ No projects found")
                     return
-            else:
-                config.project_slugs = None  # All projects
-            
-            projects = downloader.discover_projects()
-            if not projects:
-                print("❌ No projects found")
-                return
-            
-            work_dir, skip_config = downloader.setup_working_directory(projects)
+                
+                work_dir, skip_config = downloader.setup_working_directory(projects)
+                
+                if not skip_config:
+                    downloader.generate_config_for_projects(projects, work_dir)
+                else:
+                    # Count resources in existing config
+                    resource_count = downloader._count_resources_in_config(work_dir)
+                    print(f"✅ Using existing configuration ({resource_count} resources)")
+                
+                success = downloader.execute_file_download(work_dir)
             
-            if not skip_config:
-                downloader.generate_config_for_projects(projects, work_dir)
+            if success:
+                print("\n✅ Operation completed successfully")
             else:
-                # Count resources in existing config
-                resource_count = downloader._count_resources_in_config(work_dir)
-                print(f"✅ Using existing configuration ({resource_count} resources)")
-            
-            success = downloader.execute_file_download(work_dir)
-        
-        if success:
-            print("\n✅ Operation completed successfully")
-        else:
-            print("\n❌ Operation failed")
+                print("\n❌ Operation failed")
     
     except KeyboardInterrupt:
         print("\n🛑 Operation cancelled")